@@ -2,6 +2,405 @@ import numpy as np
 import numba
 
 from scipy.interpolate import splprep, splev
+from scipy.spatial import Delaunay
+
+
+_EPSILON = 2.0**-52
+
+
+@numba.njit()
+def _orient(px, py, qx, qy, rx, ry):
+    return (qy - py) * (rx - qx) - (qx - px) * (ry - qy)
+
+
+@numba.njit()
+def _in_circle(ax, ay, bx, by, cx, cy, px, py):
+    dx = ax - px
+    dy = ay - py
+    ex = bx - px
+    ey = by - py
+    fx = cx - px
+    fy = cy - py
+    ap = dx * dx + dy * dy
+    bp = ex * ex + ey * ey
+    cp = fx * fx + fy * fy
+    return (
+        dx * (ey * cp - bp * fy) - dy * (ex * cp - bp * fx) + ap * (ex * fy - ey * fx)
+        < 0
+    )
+
+
+@numba.njit()
+def _circumcenter_offset(ax, ay, bx, by, cx, cy):
+    dx = bx - ax
+    dy = by - ay
+    ex = cx - ax
+    ey = cy - ay
+    bl = dx * dx + dy * dy
+    cl = ex * ex + ey * ey
+    det = dx * ey - dy * ex
+    if det == 0:
+        return np.inf, np.inf
+    d = 0.5 / det
+    return (ey * bl - dy * cl) * d, (dx * cl - ex * bl) * d
+
+
+@numba.njit()
+def _hash_key(x, y, cx, cy, hash_size):
+    dx = x - cx
+    dy = y - cy
+    if dx == 0.0 and dy == 0.0:
+        return 0
+    p = dx / (abs(dx) + abs(dy))
+    angle = (3.0 - p) / 4.0 if dy > 0 else (1.0 + p) / 4.0
+    return int(np.floor(angle * hash_size)) % hash_size
+
+
+@numba.njit()
+def _link(halfedges, a, b):
+    halfedges[a] = b
+    if b != -1:
+        halfedges[b] = a
+
+
+@numba.njit()
+def _add_triangle(triangles, halfedges, n_triangle_edges, i0, i1, i2, a, b, c):
+    t = n_triangle_edges
+    triangles[t] = i0
+    triangles[t + 1] = i1
+    triangles[t + 2] = i2
+    _link(halfedges, t, a)
+    _link(halfedges, t + 1, b)
+    _link(halfedges, t + 2, c)
+    return t
+
+
+@numba.njit()
+def _legalize(
+    a, points, triangles, halfedges, hull_start, hull_prev, hull_tri, edge_stack
+):
+    stack_size = 0
+    ar = 0
+    while True:
+        b = halfedges[a]
+        a0 = a - a % 3
+        ar = a0 + (a + 2) % 3
+
+        if b == -1:
+            # convex hull edge; nothing to flip
+            if stack_size == 0:
+                break
+            stack_size -= 1
+            a = edge_stack[stack_size]
+            continue
+
+        b0 = b - b % 3
+        al = a0 + (a + 1) % 3
+        bl = b0 + (b + 2) % 3
+
+        p0 = triangles[ar]
+        pr = triangles[a]
+        pl = triangles[al]
+        p1 = triangles[bl]
+
+        if _in_circle(
+            points[p0, 0],
+            points[p0, 1],
+            points[pr, 0],
+            points[pr, 1],
+            points[pl, 0],
+            points[pl, 1],
+            points[p1, 0],
+            points[p1, 1],
+        ):
+            triangles[a] = p1
+            triangles[b] = p0
+
+            hbl = halfedges[bl]
+            if hbl == -1:
+                # edge swapped on the other side of the hull; fix the hull reference
+                e = hull_start
+                while True:
+                    if hull_tri[e] == bl:
+                        hull_tri[e] = a
+                        break
+                    e = hull_prev[e]
+                    if e == hull_start:
+                        break
+
+            _link(halfedges, a, hbl)
+            _link(halfedges, b, halfedges[ar])
+            _link(halfedges, ar, bl)
+
+            edge_stack[stack_size] = b0 + (b + 1) % 3
+            stack_size += 1
+        else:
+            if stack_size == 0:
+                break
+            stack_size -= 1
+            a = edge_stack[stack_size]
+
+    return ar
+
+
+@numba.njit(nogil=True)
+def sweep_hull_triangulation(points):
+    """Delaunay triangulation of 2D points using the sweep-hull algorithm of
+    Sinclair (2010), as popularised by the delaunator library.
+
+    Returns an array of triangles (as point index triples) and a flag indicating
+    whether the triangulation is consistent; degenerate inputs (e.g. collinear
+    points) produce an inconsistent result and should be handed off to Qhull.
+    """
+    n = points.shape[0]
+    max_triangles = max(2 * n - 5, 0)
+    triangles = np.empty(max_triangles * 3, dtype=np.int32)
+    failed = (np.empty((0, 3), dtype=np.int32), False)
+    if n < 3:
+        return failed
+
+    halfedges = np.full(max_triangles * 3, -1, dtype=np.int32)
+    edge_stack = np.empty(max_triangles * 3, dtype=np.int32)
+    hash_size = int(np.ceil(np.sqrt(n)))
+    hull_prev = np.zeros(n, dtype=np.int32)
+    hull_next = np.zeros(n, dtype=np.int32)
+    hull_tri = np.zeros(n, dtype=np.int32)
+    hull_hash = np.full(hash_size, -1, dtype=np.int32)
+
+    # Seed with the point closest to the centre of the bounding box...
+    cx = (points[:, 0].min() + points[:, 0].max()) / 2
+    cy = (points[:, 1].min() + points[:, 1].max()) / 2
+    i0 = 0
+    min_dist = np.inf
+    for i in range(n):
+        d = (points[i, 0] - cx) ** 2 + (points[i, 1] - cy) ** 2
+        if d < min_dist:
+            i0 = i
+            min_dist = d
+    i0x, i0y = points[i0, 0], points[i0, 1]
+
+    # ...its nearest neighbour...
+    i1 = 0
+    min_dist = np.inf
+    for i in range(n):
+        if i == i0:
+            continue
+        d = (points[i, 0] - i0x) ** 2 + (points[i, 1] - i0y) ** 2
+        if d < min_dist and d > 0:
+            i1 = i
+            min_dist = d
+    i1x, i1y = points[i1, 0], points[i1, 1]
+
+    # ...and the point forming the smallest circumcircle with them
+    i2 = 0
+    min_radius = np.inf
+    for i in range(n):
+        if i == i0 or i == i1:
+            continue
+        ux, uy = _circumcenter_offset(i0x, i0y, i1x, i1y, points[i, 0], points[i, 1])
+        r = ux * ux + uy * uy
+        if r < min_radius:
+            i2 = i
+            min_radius = r
+    if not np.isfinite(min_radius):
+        return failed
+    i2x, i2y = points[i2, 0], points[i2, 1]
+
+    if _orient(i0x, i0y, i1x, i1y, i2x, i2y) < 0:
+        i1, i2 = i2, i1
+        i1x, i1y, i2x, i2y = i2x, i2y, i1x, i1y
+
+    ux, uy = _circumcenter_offset(i0x, i0y, i1x, i1y, i2x, i2y)
+    cx = i0x + ux
+    cy = i0y + uy
+
+    # Sweep the remaining points in order of distance from the seed circumcentre
+    dists = (points[:, 0] - cx) ** 2 + (points[:, 1] - cy) ** 2
+    ids = np.argsort(dists)
+
+    hull_start = i0
+    hull_size = 3
+    hull_next[i0] = hull_prev[i2] = i1
+    hull_next[i1] = hull_prev[i0] = i2
+    hull_next[i2] = hull_prev[i1] = i0
+    hull_tri[i0] = 0
+    hull_tri[i1] = 1
+    hull_tri[i2] = 2
+    hull_hash[_hash_key(i0x, i0y, cx, cy, hash_size)] = i0
+    hull_hash[_hash_key(i1x, i1y, cx, cy, hash_size)] = i1
+    hull_hash[_hash_key(i2x, i2y, cx, cy, hash_size)] = i2
+
+    _add_triangle(triangles, halfedges, 0, i0, i1, i2, -1, -1, -1)
+    n_triangle_edges = 3
+    n_used = 3
+
+    xp = 0.0
+    yp = 0.0
+    for k in range(n):
+        i = ids[k]
+        x = points[i, 0]
+        y = points[i, 1]
+
+        # skip near-duplicate points
+        if k > 0 and abs(x - xp) <= _EPSILON and abs(y - yp) <= _EPSILON:
+            continue
+        xp = x
+        yp = y
+
+        if i == i0 or i == i1 or i == i2:
+            continue
+
+        # find a visible edge on the convex hull using the edge hash
+        start = 0
+        key = _hash_key(x, y, cx, cy, hash_size)
+        for j in range(hash_size):
+            start = hull_hash[(key + j) % hash_size]
+            if start != -1 and start != hull_next[start]:
+                break
+
+        start = hull_prev[start]
+        e = start
+        while True:
+            q = hull_next[e]
+            if (
+                _orient(x, y, points[e, 0], points[e, 1], points[q, 0], points[q, 1])
+                < 0
+            ):
+                break
+            e = q
+            if e == start:
+                e = -1
+                break
+        if e == -1:
+            # likely a near-duplicate point; skip it
+            continue
+
+        # add the first triangle from the point and flip until Delaunay
+        t = _add_triangle(
+            triangles,
+            halfedges,
+            n_triangle_edges,
+            e,
+            i,
+            hull_next[e],
+            -1,
+            -1,
+            hull_tri[e],
+        )
+        n_triangle_edges += 3
+        hull_tri[i] = _legalize(
+            t + 2,
+            points,
+            triangles,
+            halfedges,
+            hull_start,
+            hull_prev,
+            hull_tri,
+            edge_stack,
+        )
+        hull_tri[e] = t
+        hull_size += 1
+        n_used += 1
+
+        # walk forward through the hull, adding more triangles and flipping
+        nxt = hull_next[e]
+        while True:
+            q = hull_next[nxt]
+            if (
+                _orient(
+                    x, y, points[nxt, 0], points[nxt, 1], points[q, 0], points[q, 1]
+                )
+                >= 0
+            ):
+                break
+            t = _add_triangle(
+                triangles,
+                halfedges,
+                n_triangle_edges,
+                nxt,
+                i,
+                q,
+                hull_tri[i],
+                -1,
+                hull_tri[nxt],
+            )
+            n_triangle_edges += 3
+            hull_tri[i] = _legalize(
+                t + 2,
+                points,
+                triangles,
+                halfedges,
+                hull_start,
+                hull_prev,
+                hull_tri,
+                edge_stack,
+            )
+            hull_next[nxt] = nxt  # mark as removed
+            hull_size -= 1
+            nxt = q
+
+        # walk backward from the other side, adding more triangles and flipping
+        if e == start:
+            while True:
+                q = hull_prev[e]
+                if (
+                    _orient(
+                        x, y, points[q, 0], points[q, 1], points[e, 0], points[e, 1]
+                    )
+                    >= 0
+                ):
+                    break
+                t = _add_triangle(
+                    triangles,
+                    halfedges,
+                    n_triangle_edges,
+                    q,
+                    i,
+                    e,
+                    -1,
+                    hull_tri[e],
+                    hull_tri[q],
+                )
+                n_triangle_edges += 3
+                _legalize(
+                    t + 2,
+                    points,
+                    triangles,
+                    halfedges,
+                    hull_start,
+                    hull_prev,
+                    hull_tri,
+                    edge_stack,
+                )
+                hull_tri[q] = t
+                hull_next[e] = e  # mark as removed
+                hull_size -= 1
+                e = q
+
+        # update the hull indices
+        hull_start = hull_prev[i] = e
+        hull_next[e] = hull_prev[nxt] = i
+        hull_next[i] = nxt
+
+        hull_hash[_hash_key(x, y, cx, cy, hash_size)] = i
+        hull_hash[_hash_key(points[e, 0], points[e, 1], cx, cy, hash_size)] = e
+
+    # A valid triangulation of m points with h of them on the hull has 2m - 2 - h
+    # triangles; anything else means the floating point predicates let us down
+    n_triangles = n_triangle_edges // 3
+    consistent = n_triangles == 2 * n_used - 2 - hull_size
+    return triangles[:n_triangle_edges].reshape((n_triangles, 3)), consistent
+
+
+def delaunay_simplices(points):
+    """Delaunay triangulation simplices for a set of 2D points; uses the numba
+    sweep-hull triangulation, falling back to Qhull for degenerate inputs."""
+    simplices, consistent = sweep_hull_triangulation(
+        np.ascontiguousarray(points, dtype=np.float64)
+    )
+    if not consistent:
+        simplices = Delaunay(points, qhull_options="Qbb Qc Qz Q12 Q7").simplices
+    return simplices
 
 
 @numba.njit()
@@ -17,68 +416,136 @@ def circumradius(points):
     return np.sqrt(ux * ux + uy * uy)
 
 
-@numba.njit(locals={"candidate_idx": numba.uint64})
+@numba.njit()
+def _simplex_circumradius(points, i, j, k):
+    # As circumradius, for the triangle points[[i, j, k]], but working on
+    # scalars directly so no temporary arrays are allocated per triangle
+    b0 = points[j, 0] - points[i, 0]
+    b1 = points[j, 1] - points[i, 1]
+    c0 = points[k, 0] - points[i, 0]
+    c1 = points[k, 1] - points[i, 1]
+    d = 2 * (b0 * c1 - b1 * c0)
+    if d == 0:
+        return 0
+    b_norm = b0 * b0 + b1 * b1
+    c_norm = c0 * c0 + c1 * c1
+    ux = (c1 * b_norm - b1 * c_norm) / d
+    uy = (b0 * c_norm - c0 * b_norm) / d
+    return np.sqrt(ux * ux + uy * uy)
+
+
+@numba.njit(nogil=True, locals={"candidate_idx": numba.uint64})
 def find_boundary_candidates(points, simplices, alpha=0.1):
     candidates = np.full((simplices.shape[0] * 3, 2), -1, dtype=np.int32)
     candidate_idx = 0
     for simplex in simplices:
-        if circumradius(points[simplex]) < alpha:
+        if _simplex_circumradius(points, simplex[0], simplex[1], simplex[2]) < alpha:
             candidates[candidate_idx] = (simplex[0], simplex[1])
             candidates[candidate_idx + 1] = (simplex[0], simplex[2])
             candidates[candidate_idx + 2] = (simplex[1], simplex[2])
             candidate_idx += 3
     return candidates[:candidate_idx]
 
-@numba.njit()
-def boundary_from_candidates(boundary_candidates):
-    occurrence_counts = {(np.int32(0), np.int32(0)):0 for i in range(0)}
-    for candidate in boundary_candidates:
-        tuple_candidate = (candidate[0], candidate[1])
-        if tuple_candidate in occurrence_counts:
-            occurrence_counts[tuple_candidate] += 1
-        else:
-            occurrence_counts[tuple_candidate] = 1
+@numba.njit(nogil=True)
+def boundary_from_candidates(boundary_candidates, n_points):
+    # Boundary edges are those that occur in exactly one candidate triangle; with
+    # each edge encoded as a single integer key, a sort brings duplicates together
+    n_candidates = boundary_candidates.shape[0]
+    keys = np.empty(n_candidates, dtype=np.int64)
+    for i in range(n_candidates):
+        keys[i] = (
+            np.int64(boundary_candidates[i, 0]) * n_points + boundary_candidates[i, 1]
+        )
+    keys.sort()
 
-    return set([x for x in occurrence_counts if occurrence_counts[x] == 1])
+    boundary = np.empty((n_candidates, 2), dtype=np.int32)
+    n_edges = 0
+    i = 0
+    while i < n_candidates:
+        j = i + 1
+        while j < n_candidates and keys[j] == keys[i]:
+            j += 1
+        if j - i == 1:
+            boundary[n_edges, 0] = keys[i] // n_points
+            boundary[n_edges, 1] = keys[i] % n_points
+            n_edges += 1
+        i = j
 
-@numba.njit()
-def build_polygons(boundary):
-    polygons = []
-    search_set = boundary.copy()
-    sequence = list(search_set.pop())
-    while len(search_set) > 0:
-        to_find = sequence[-1]
-        for link in search_set:
-            if link[0] == to_find:
-                sequence.append(link[1])
-                search_set.remove(link)
-                break
-            elif link[1] == to_find:
-                sequence.append(link[0])
-                search_set.remove(link)
+    return boundary[:n_edges]
+
+
+@numba.njit(nogil=True)
+def build_polygons(boundary, n_points):
+    # Chain boundary edges into polygons by walking from vertex to vertex along
+    # unused edges, with a per vertex edge index so each step is constant time.
+    # Returns the concatenated polygon vertex sequences and their offsets.
+    n_edges = boundary.shape[0]
+    edge_offsets = np.zeros(n_points + 1, dtype=np.int64)
+    for e in range(n_edges):
+        edge_offsets[boundary[e, 0] + 1] += 1
+        edge_offsets[boundary[e, 1] + 1] += 1
+    edge_offsets = np.cumsum(edge_offsets)
+    cursor = edge_offsets[:-1].copy()
+    incident_edges = np.empty(edge_offsets[-1], dtype=np.int64)
+    for e in range(n_edges):
+        for end in range(2):
+            vertex = boundary[e, end]
+            incident_edges[cursor[vertex]] = e
+            cursor[vertex] += 1
+    cursor = edge_offsets[:-1].copy()
+
+    used = np.zeros(n_edges, dtype=np.bool_)
+    sequences = np.empty(2 * n_edges, dtype=np.int64)
+    polygon_offsets = [0]
+    n_vertices = 0
+    for start in range(n_edges):
+        if used[start]:
+            continue
+        used[start] = True
+        sequences[n_vertices] = boundary[start, 0]
+        sequences[n_vertices + 1] = boundary[start, 1]
+        n_vertices += 2
+        current = boundary[start, 1]
+        while True:
+            # Skip past edges already used; they stay used, so never revisit them
+            next_edge = -1
+            while cursor[current] < edge_offsets[current + 1]:
+                e = incident_edges[cursor[current]]
+                cursor[current] += 1
+                if not used[e]:
+                    next_edge = e
+                    break
+            if next_edge < 0:
                 break
-        else:
-            polygons.append(sequence.copy())
-            sequence = list(search_set.pop())
+            used[next_edge] = True
+            if boundary[next_edge, 0] == current:
+                current = boundary[next_edge, 1]
+            else:
+                current = boundary[next_edge, 0]
+            sequences[n_vertices] = current
+            n_vertices += 1
+        polygon_offsets.append(n_vertices)
+
+    return sequences[:n_vertices], np.array(polygon_offsets)
 
-    polygons.append(sequence)
-    return polygons
 
 def create_boundary_polygons(points, simplices, alpha=0.1):
     simplices.sort(axis=1)
     boundary_candidates = find_boundary_candidates(points, simplices, alpha=alpha)
-    boundary = boundary_from_candidates(boundary_candidates)
+    boundary = boundary_from_candidates(boundary_candidates, points.shape[0])
     if len(boundary) == 0:
         raise ValueError("The value of polygon_alpha was too low, and no boundary was formed. Try increasing polygon_alpha.")
-    polygons = build_polygons(boundary)
+    sequences, polygon_offsets = build_polygons(boundary, points.shape[0])
 
-    result = [
-        np.empty((len(sequence) + 1, 2), dtype=np.float32) for sequence in polygons
-    ]
-    for s, sequence in enumerate(polygons):
-        for i, n in enumerate(sequence):
-            result[s][i] = points[n]
-        result[s][-1] = points[sequence[0]]
+    # Gather each (closed) polygon's vertices in one indexing operation
+    result = []
+    for start, end in zip(polygon_offsets[:-1], polygon_offsets[1:]):
+        vertex_indices = sequences[start:end]
+        result.append(
+            points[np.append(vertex_indices, vertex_indices[0])].astype(
+                np.float32, copy=False
+            )
+        )
 
     return result
 
@@ -91,4 +558,4 @@ def smooth_polygon(p, point_multipler=4, spline_coeff=0.0001):
     interp_d = np.linspace(dist_along[0], dist_along[-1], len(p) * point_multipler)
     interp_x, interp_y = splev(interp_d, spline)
 
-    return np.vstack([interp_x, interp_y]).T
+    return np.column_stack((interp_x, interp_y))
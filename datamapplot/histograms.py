@@ -43,6 +43,45 @@ _NAME_TO_PERIOD_CODE = {
 }
 
 
+def _bin_counts_and_indices(data, bins_ids, n_bins):
+    """
+    Count the data points in each bin, and collect the index labels of the data
+    points in each bin, using a single sort rather than a groupby with Python
+    level aggregation functions.
+
+    Parameters
+    ----------
+    data : pd.Series
+        The binned data.
+    bins_ids : pd.Series or np.ndarray
+        The (possibly missing) bin id of each entry in the data.
+    n_bins : int
+        The number of bins.
+
+    Returns
+    -------
+    np.ndarray
+    The number of non-null data points in each bin.
+
+    list
+    A list, per bin, of the index labels of the data points in the bin.
+    """
+    bin_array = np.asarray(bins_ids, dtype=np.float64)
+    in_bin = np.isfinite(bin_array)
+    binned_ids = bin_array[in_bin].astype(np.intp)
+
+    counts = np.bincount(
+        binned_ids[data.notna().to_numpy()[in_bin]], minlength=n_bins
+    )[:n_bins]
+
+    order = np.argsort(binned_ids, kind="stable")
+    sorted_index = data.index.to_numpy()[in_bin][order]
+    split_points = np.searchsorted(binned_ids[order], np.arange(1, n_bins))
+    indices = [chunk.tolist() for chunk in np.split(sorted_index, split_points)]
+
+    return counts, indices
+
+
 def generate_bins_from_numeric_data(
     data: pd.Series,
     n_bins: int = 20,
@@ -88,24 +127,13 @@ def generate_bins_from_numeric_data(
             bins_ids = np.where(data < from_value, 0, bins_ids)
             bins_ids = np.where(data > to_value, len(bin_edges) - 1, bins_ids)
 
-    all_bins = pd.DataFrame({"id": range(n_bins)})
-
-    bin_data = (
-        data.groupby(bins_ids, group_keys=True)
-        .agg(count="count", indices=lambda x: list(x.index))
-        .reset_index(names=["id"])
-    )
-
-    bin_data = all_bins.merge(bin_data, on="id", how="left")
+    counts, indices = _bin_counts_and_indices(data, bins_ids, n_bins)
+    bin_data = pd.DataFrame({"id": range(n_bins), "count": counts, "indices": indices})
 
     bin_data["min_value"] = bin_edges[:-1]
     bin_data["max_value"] = bin_edges[1:]
     # lower bin plus difference over two to allow to dates/times to work with averages as well
     bin_data["mean_value"] = bin_edges[:-1] + (bin_edges[1:] - bin_edges[:-1]) / 2
-    bin_data["count"] = bin_data["count"].fillna(0)
-    bin_data["indices"] = bin_data["indices"].apply(
-        lambda x: x if isinstance(x, list) else []
-    )
 
     return bin_data, bins_ids.astype(np.int16).rename("bin_id")
 
@@ -142,25 +170,25 @@ def generate_bins_from_categorical_data(
     if isinstance(data, np.ndarray):
         data = pd.Series(data)
     top_values = data.value_counts().head(max_bins - 1).index
-    bins_ids = data.apply(lambda x: x if x in top_values else "Other")
-    bin_data = (
-        data.groupby(bins_ids)
-        .agg(count="count", indices=lambda x: list(x.index))
-        .reset_index(names=["label"])
-        .reset_index(names=["id"])
+    bins_labels = data.where(data.isin(top_values), "Other")
+    bins_ids, labels = pd.factorize(bins_labels, sort=True)
+    counts, indices = _bin_counts_and_indices(data, bins_ids, len(labels))
+    bin_data = pd.DataFrame(
+        {
+            "id": range(len(labels)),
+            "label": labels,
+            "count": counts,
+            "indices": indices,
+        }
     )
 
     bin_data["min_value"] = bin_data["id"]
     bin_data["max_value"] = bin_data["id"]
     bin_data["mean_value"] = bin_data["label"]
-    bin_data["count"] = bin_data["count"].fillna(0)
-    bin_data["indices"] = bin_data["indices"].apply(
-        lambda x: x if isinstance(x, list) else []
-    )
 
-    return bin_data, bins_ids.map(dict(bin_data[["label", "id"]].values)).astype(
+    return bin_data, pd.Series(bins_ids, index=data.index, name="bin_id").astype(
         np.int16
-    ).rename("bin_id")
+    )
 
 
 def generate_bins_from_temporal_data(
@@ -214,23 +242,13 @@ def generate_bins_from_temporal_data(
         bins_ids = np.where(data >= to_date, len(bin_edges) - 1, bins_ids)
         bins_ids = pd.Series(bins_ids)
 
-    all_bins = pd.DataFrame({"id": range(len(bin_edges) - 1)})
-
-    bin_data = (
-        data.groupby(bins_ids, group_keys=True)
-        .agg(count="count", indices=lambda x: list(x.index))
-        .reset_index(names=["id"])
-    )
-
-    bin_data = all_bins.merge(bin_data, on="id", how="left")
+    n_bins = len(bin_edges) - 1
+    counts, indices = _bin_counts_and_indices(data, bins_ids, n_bins)
+    bin_data = pd.DataFrame({"id": range(n_bins), "count": counts, "indices": indices})
 
     bin_data["min_value"] = bin_edges[:-1]
     bin_data["max_value"] = bin_edges[1:]
     # lower bin plus difference over two to allow to dates/times to work with averages as well
     bin_data["mean_value"] = bin_edges[:-1] + (bin_edges[1:] - bin_edges[:-1]) / 2
-    bin_data["count"] = bin_data["count"].fillna(0)
-    bin_data["indices"] = bin_data["indices"].apply(
-        lambda x: x if isinstance(x, list) else []
-    )
 
     return bin_data, bins_ids.fillna(0).astype(np.int16).rename("bin_id")
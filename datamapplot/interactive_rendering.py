@@ -1,7 +1,8 @@
-import base64
+import functools
 import gzip
 import html
 import io
+import math
 import os
 import warnings
 import zipfile
@@ -9,19 +10,21 @@ import json
 import platformdirs
 
 import jinja2
+import numba
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 import requests
 import re
 from importlib_resources import files
-from matplotlib.colors import to_rgba
+from matplotlib.colors import to_rgba, to_rgba_array
 from pathlib import Path
+from pyarrow import feather
 from rcssmin import cssmin
 from rjsmin import jsmin
-from scipy.spatial import Delaunay
-from colorspacious import cspace_convert
-from sklearn.cluster import KMeans
+from colorspacious import cspace_convert, CIECAM02Space, CAM02UCS
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 
 from pandas.api.types import is_string_dtype, is_numeric_dtype, is_datetime64_any_dtype
 
@@ -30,8 +33,12 @@ from datamapplot.histograms import (
     generate_bins_from_categorical_data,
     generate_bins_from_temporal_data,
 )
-from datamapplot.alpha_shapes import create_boundary_polygons, smooth_polygon
-from datamapplot.medoids import medoid
+from datamapplot.alpha_shapes import (
+    create_boundary_polygons,
+    delaunay_simplices,
+    smooth_polygon,
+)
+from datamapplot.medoids import medoids
 from datamapplot.config import ConfigManager
 from datamapplot import offline_mode_caching
 from datamapplot.selection_handlers import SelectionHandlerBase
@@ -42,7 +49,18 @@ try:
     get_cmap = matplotlib.colormaps.get_cmap
 except ImportError:
     from matplotlib.cm import get_cmap
-from matplotlib.colors import rgb2hex
+
+try:
+    # pybase64 is a drop-in, SIMD accelerated base64 encoder; use it if available
+    from pybase64 import b64encode
+except ImportError:
+    from base64 import b64encode
+
+try:
+    # orjson is a much faster JSON serializer, producing UTF-8 bytes directly
+    import orjson
+except ImportError:
+    orjson = None
 
 from warnings import warn
 
@@ -75,6 +93,10 @@ _DEFAULT_CONTINUOUS_COLORMAPS = [
     "cet_gouldian",
 ]
 
+_DISCRETE_COLORMAP_SIZES = {
+    cmap: len(get_cmap(cmap).colors) for cmap in _DEFAULT_DICRETE_COLORMAPS
+}
+
 _CLUSTER_LAYER_DESCRIPTORS = {
     9: [
         "Top",
@@ -140,6 +162,10 @@ _CLUSTER_LAYER_DESCRIPTORS = {
 
 cfg = ConfigManager()
 
+# Data payloads are decompressed once in the browser, but compressed on every
+# render; the fastest deflate level costs little size for a large speed gain
+_GZIP_COMPRESSLEVEL = 1
+
 _DECKGL_TEMPLATE_STR = (files("datamapplot") / "deckgl_template.html").read_text(
     encoding="utf-8"
 )
@@ -207,6 +233,38 @@ _NOTEBOOK_NON_INLINE_WORKER = """
 """
 
 
+_WORKER_BLOB_START = "const parsingWorkerBlob"
+_WORKER_BLOB_END = "'application/javascript' });"
+_BUNDLE_DATA_FILE_PATTERN = re.compile(r"/(.*?_data(?:_\d+)?\.zip)")
+
+
+@functools.lru_cache(maxsize=8)
+def _compiled_template(template_str):
+    """Parse and compile a jinja2 template once, on first use, rather than on
+    every render (or at import time, where it would slow down the import for
+    users who never create interactive plots)."""
+    return jinja2.Template(template_str)
+
+
+def _replace_delimited(text, start, end, replacement):
+    """Replace every span of ``text`` beginning with the literal ``start`` and
+    ending with the first following literal ``end`` with ``replacement``."""
+    pieces = []
+    position = 0
+    while True:
+        span_start = text.find(start, position)
+        if span_start < 0:
+            break
+        span_end = text.find(end, span_start + len(start))
+        if span_end < 0:
+            break
+        pieces.append(text[position:span_start])
+        pieces.append(replacement)
+        position = span_end + len(end)
+    pieces.append(text[position:])
+    return "".join(pieces)
+
+
 class FormattingDict(dict):
     def __missing__(self, key):
         return f"{{{key}}}"
@@ -249,11 +307,11 @@ class InteractiveFigure:
                 "originURL = self.location.origin + directoryPath;",
                 "originURL = document.baseURI.substring(0, document.baseURI.lastIndexOf('/')).replace(/(notebooks|lab.*tree)/, 'api/contents');",
             )
-            jupyter_html_str = re.sub(
-                r"const parsingWorkerBlob.*?\'application/javascript\' \}\);",
-                _NOTEBOOK_NON_INLINE_WORKER,
+            jupyter_html_str = _replace_delimited(
                 jupyter_html_str,
-                flags=re.DOTALL,
+                _WORKER_BLOB_START,
+                _WORKER_BLOB_END,
+                _NOTEBOOK_NON_INLINE_WORKER,
             )
             if self.api_token is not None:
                 jupyter_html_str = jupyter_html_str.replace(
@@ -293,15 +351,33 @@ class InteractiveFigure:
         """Save an interactive figure to a zip file with name `filename`"""
         with zipfile.ZipFile(filename, "w") as zf:
             zf.writestr("index.html", self._html_str)
-            for filename in re.findall(r"/(.*?_data(?:_\d+)?\.zip)", self._html_str):
+            for filename in _BUNDLE_DATA_FILE_PATTERN.findall(self._html_str):
                 print(f"Adding {filename} to bundle")
                 zf.write(filename)
 
 
-def get_google_font_for_embedding(fontname, offline_mode=False):
+@functools.lru_cache(maxsize=4)
+def _load_json_file(path, mtime_ns, size):
+    with open(path, "rb") as f:
+        content = f.read()
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _load_offline_data_file(path):
+    # The offline mode JS and font caches can run to tens of megabytes, so only
+    # parse them again if the file has changed since it was last loaded
+    stat = os.stat(path)
+    return _load_json_file(os.fspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+def get_google_font_for_embedding(fontname, offline_mode=False, offline_font_file=None):
     api_fontname = fontname.replace(" ", "+")
     if offline_mode:
-        all_encoded_fonts = offline_mode_caching.load_fonts()
+        if offline_font_file is None:
+            offline_font_file = offline_mode_caching.DEFAULT_CACHE_FILES["fonts"]
+        all_encoded_fonts = _load_offline_data_file(offline_font_file)
         encoded_fonts = all_encoded_fonts.get(fontname, None)
         if encoded_fonts is not None:
             font_descriptions = [
@@ -329,28 +405,56 @@ def get_google_font_for_embedding(fontname, offline_mode=False):
         else:
             return ""
 
+    try:
+        return _google_font_links(api_fontname)
+    except requests.RequestException:
+        # On network or HTTP errors, fall back to the browser's own font matching
+        return ""
+
+
+@functools.lru_cache(maxsize=32)
+def _google_font_links(api_fontname):
+    # Network and HTTP errors (e.g. rate limiting) are raised to the caller
+    # rather than returned, so that transient failures are not cached
     api_response = requests.get(
         f"https://fonts.googleapis.com/css?family={api_fontname}:black,bold,regular,light",
         timeout=10,
     )
-    if api_response.ok:
-        font_urls = re.findall(r"(https?://[^\)]+)", str(api_response.content))
-        font_links = []
-        for url in font_urls:
-            if url.endswith(".ttf"):
-                font_links.append(
-                    f'<link rel="preload" href="{url}" as="font" crossorigin="anonymous" type="font/ttf" />'
-                )
-            elif url.endswith(".woff2"):
-                font_links.append(
-                    f'<link rel="preload" href="{url}" as="font" crossorigin="anonymous" type="font/woff2" />'
-                )
-        return (
-            "\n".join(font_links)
-            + f"\n<style>\n{api_response.content.decode()}\n</style>\n"
-        )
-    else:
-        return ""
+    api_response.raise_for_status()
+    font_urls = re.findall(r"(https?://[^\)]+)", str(api_response.content))
+    font_links = []
+    for url in font_urls:
+        if url.endswith(".ttf"):
+            font_links.append(
+                f'<link rel="preload" href="{url}" as="font" crossorigin="anonymous" type="font/ttf" />'
+            )
+        elif url.endswith(".woff2"):
+            font_links.append(
+                f'<link rel="preload" href="{url}" as="font" crossorigin="anonymous" type="font/woff2" />'
+            )
+    return (
+        "\n".join(font_links)
+        + f"\n<style>\n{api_response.content.decode()}\n</style>\n"
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _google_font_is_available(fontname, timeout=5):
+    # Only the status matters, so a HEAD request suffices; answers are cached,
+    # while network errors propagate (and so are not cached) for the caller
+    api_fontname = fontname.replace(" ", "+")
+    resp = requests.head(
+        f"https://fonts.googleapis.com/css?family={api_fontname}",
+        timeout=timeout,
+    )
+    return resp.ok
+
+
+def _tooltip_font_is_available(fontname):
+    try:
+        return _google_font_is_available(fontname)
+    except requests.RequestException:
+        return False
 
 
 def _get_js_dependency_sources(
@@ -509,20 +613,24 @@ def default_colormap_options(values_dict):
 
         if values.dtype.kind in ["U", "S", "O"]:
             colormap_metadata["kind"] = "categorical"
-            n_categories = len(values.unique())
-            n = 0
-            cmap = _DEFAULT_DICRETE_COLORMAPS[n]
-            while cmap in used_colormaps or n_categories > len(get_cmap(cmap).colors):
-                n += 1
-                if n >= len(_DEFAULT_DICRETE_COLORMAPS):
-                    n = 0
-                    cmap = _DEFAULT_DICRETE_COLORMAPS[n]
-                    while cmap in used_colormaps:
-                        n += 1
-                        cmap = _DEFAULT_DICRETE_COLORMAPS[n]
-                    break
-                else:
-                    cmap = _DEFAULT_DICRETE_COLORMAPS[n]
+            n_categories = pd.unique(values).size
+            # Prefer the first unused colormap with enough colours, falling back
+            # to the first unused colormap if none are large enough
+            unused_colormaps = [
+                cmap
+                for cmap in _DEFAULT_DICRETE_COLORMAPS
+                if cmap not in used_colormaps
+            ]
+            if len(unused_colormaps) == 0:
+                unused_colormaps = _DEFAULT_DICRETE_COLORMAPS
+            cmap = next(
+                (
+                    cmap
+                    for cmap in unused_colormaps
+                    if _DISCRETE_COLORMAP_SIZES[cmap] >= n_categories
+                ),
+                unused_colormaps[0],
+            )
             colormap_metadata["cmap"] = cmap
             used_colormaps.add(cmap)
         elif pd.api.types.is_datetime64_any_dtype(values):
@@ -543,12 +651,59 @@ def default_colormap_options(values_dict):
     return colormap_metadata_list
 
 
+_HEX_BYTES = [f"{i:02x}" for i in range(256)]
+
+
+def _rgb_array_to_hex(rgb_array):
+    """Convert an array of RGB(A) colours with float channels in ``[0, 1]`` to a
+    list of ``#rrggbb`` hex strings, rounding as ``matplotlib.colors.rgb2hex``
+    does."""
+    rgb = np.round(np.asarray(rgb_array, dtype=np.float64)[:, :3] * 255)
+    return [
+        f"#{_HEX_BYTES[r]}{_HEX_BYTES[g]}{_HEX_BYTES[b]}"
+        for r, g, b in rgb.astype(np.intp).tolist()
+    ]
+
+
 def cmap_name_to_color_list(cmap_name):
     cmap = get_cmap(cmap_name)
     if hasattr(cmap, "colors"):
-        result = [rgb2hex(c) for c in cmap.colors]
+        result = _rgb_array_to_hex(to_rgba_array(cmap.colors))
     else:
-        result = [rgb2hex(cmap(i)) for i in np.linspace(0, 1, 128)]
+        result = _rgb_array_to_hex(cmap(np.linspace(0, 1, 128)))
+    return result
+
+
+def _cmap_lookup_table(cmap):
+    """The colours of ``cmap`` as an ``(N, 4)`` uint8 lookup table, such that
+    ``lut[min(int(x * N), N - 1)]`` matches ``cmap(x)`` for ``x`` in ``[0, 1]``."""
+    return (cmap(np.arange(cmap.N)) * 255).astype(np.uint8)
+
+
+@functools.lru_cache(maxsize=64)
+def _named_cmap_lookup_table(cmap_name):
+    lut = _cmap_lookup_table(get_cmap(cmap_name))
+    # The table is shared between calls, so guard against modification
+    lut.setflags(write=False)
+    return lut
+
+
+@numba.njit(parallel=True)
+def _normalized_lut_colors(values, valid_mask, vmin, vmax, lut):
+    """Normalize ``values`` to ``[0, 1]`` with respect to ``vmin`` and ``vmax``
+    and gather the corresponding uint8 colours from ``lut`` in a single pass.
+    Invalid values are assigned transparent black."""
+    n_colors = lut.shape[0]
+    result = np.zeros((values.shape[0], 4), dtype=np.uint8)
+    for i in numba.prange(values.shape[0]):
+        if valid_mask[i]:
+            if vmax != vmin:
+                normalized = (values[i] - vmin) / (vmax - vmin)
+            else:
+                normalized = 0.5
+            lut_idx = min(int(normalized * n_colors), n_colors - 1)
+            for j in range(4):
+                result[i, j] = lut[lut_idx, j]
     return result
 
 
@@ -562,13 +717,21 @@ def array_to_colors(values, cmap_name, metadata, color_list=None):
         color_list = [to_rgba(color) for color in color_list]
     else:
         cmap = get_cmap(cmap_name)
+        if isinstance(cmap_name, str):
+            cmap_lut = _named_cmap_lookup_table(cmap_name)
+        else:
+            cmap_lut = _cmap_lookup_table(cmap)
 
     # Function to get finite/non-null mask
     def get_valid_mask(arr):
-        if pd.api.types.is_datetime64_any_dtype(arr):
-            return ~pd.isna(arr)
-        elif arr.dtype.kind in ["f", "i"]:
+        kind = arr.dtype.kind
+        if kind in ["i", "u", "b"]:
+            # Integer and boolean values are always valid
+            return np.broadcast_to(True, arr.shape)
+        elif kind == "f":
             return np.isfinite(arr)
+        elif kind == "M":
+            return ~np.isnat(arr)
         else:
             return ~pd.isna(arr)
 
@@ -577,27 +740,25 @@ def array_to_colors(values, cmap_name, metadata, color_list=None):
         if cmap is None:
             raise ValueError("cmap must be provided for datetime data")
 
-        valid_mask = get_valid_mask(values)
+        # Work directly on the underlying int64 timestamps; NaT is stored as the
+        # minimum int64 value
+        time_unit, _ = np.datetime_data(values.dtype)
+        int_values = values.view(np.int64)
+        valid_mask = int_values != np.iinfo(np.int64).min
         if not np.any(valid_mask):
             raise ValueError("No valid datetime values found")
 
-        valid_values = values[valid_mask]
+        valid_values = int_values[valid_mask]
         vmin, vmax = valid_values.min(), valid_values.max()
 
-        # Convert to float for normalization
-        normalized_values = np.zeros_like(values, dtype=float)
-        normalized_values[valid_mask] = (
-            (valid_values - vmin) / (vmax - vmin) if vmin != vmax else 0.5
+        colors_array = _normalized_lut_colors(
+            int_values, valid_mask, vmin, vmax, cmap_lut
         )
 
-        colors_array = np.zeros((len(values), 4))
-        colors_array[valid_mask] = cmap(normalized_values[valid_mask])
-        colors_array[~valid_mask] = [0, 0, 0, 0]  # Transparent for invalid values
-
         # Store datetime range as ISO format strings
         metadata["valueRange"] = [
-            pd.Timestamp(vmin).isoformat(),
-            pd.Timestamp(vmax).isoformat(),
+            pd.Timestamp(np.datetime64(int(vmin), time_unit)).isoformat(),
+            pd.Timestamp(np.datetime64(int(vmax), time_unit)).isoformat(),
         ]
         metadata["kind"] = "datetime"
 
@@ -606,8 +767,10 @@ def array_to_colors(values, cmap_name, metadata, color_list=None):
         if not np.any(valid_mask):
             raise ValueError("No valid string values found")
 
-        # Get unique valid values
-        unique_values = np.unique(values[valid_mask])
+        # Get unique valid values; hash based uniquing is much cheaper than
+        # np.unique for object arrays, and sorting only the uniques retains the
+        # sorted value to colour assignment
+        unique_values = np.sort(pd.unique(values[valid_mask]))
 
         if cmap:
             n_colors = len(cmap.colors) if hasattr(cmap, "colors") else 256
@@ -634,9 +797,12 @@ def array_to_colors(values, cmap_name, metadata, color_list=None):
             ]
             colors_array[~valid_mask] = [0, 0, 0, 0]  # Transparent for invalid values
 
-            metadata["colorMapping"] = {
-                str(key): rgb2hex(color) for key, color in value_to_color.items()
-            }
+            metadata["colorMapping"] = dict(
+                zip(
+                    map(str, value_to_color.keys()),
+                    _rgb_array_to_hex(np.asarray(list(value_to_color.values()))),
+                )
+            )
             metadata["kind"] = "categorical"
 
         else:
@@ -676,58 +842,113 @@ def array_to_colors(values, cmap_name, metadata, color_list=None):
         valid_values = values[valid_mask]
         vmin, vmax = valid_values.min(), valid_values.max()
 
-        normalized_values = np.zeros_like(values, dtype=float)
-        normalized_values[valid_mask] = (
-            (valid_values - vmin) / (vmax - vmin) if vmin != vmax else 0.5
+        colors_array = _normalized_lut_colors(
+            values, valid_mask, vmin, vmax, cmap_lut
         )
 
-        colors_array = np.zeros((len(values), 4))
-        colors_array[valid_mask] = cmap(normalized_values[valid_mask])
-        colors_array[~valid_mask] = [0, 0, 0, 0]  # Transparent for invalid values
-
         metadata["valueRange"] = [float(vmin), float(vmax)]
         metadata["kind"] = "continuous"
 
-    return (colors_array * 255).astype(np.uint8)
+    if colors_array.dtype == np.uint8:
+        return colors_array
+    else:
+        return (colors_array * 255).astype(np.uint8)
 
 
-def color_sample_from_colors(color_array, n_swatches=5):
-    jch_colors = cspace_convert(color_array[:, :3], "sRGB1", "JCh")
-    cielab_colors = cspace_convert(jch_colors[jch_colors.T[1] > 20], "JCh", "CAM02-UCS")
-    quantizer = KMeans(n_clusters=n_swatches, random_state=0, n_init=1).fit(
-        cielab_colors
+def _chromatic_cam02ucs_colors(cam02ucs_colors, min_chroma=20):
+    """Keep only the CAM02-UCS colours with CIECAM02 chroma greater than
+    ``min_chroma``. The chroma filter is applied in CAM02-UCS space via the
+    equivalent bound on the compressed colourfulness, so no further colourspace
+    conversion is required."""
+    min_colorfulness = min_chroma * CIECAM02Space.sRGB.F_L**0.25
+    min_compressed_colorfulness = (
+        np.log1p(CAM02UCS.c2 * min_colorfulness) / CAM02UCS.c2
     )
-    result = [
-        rgb2hex(c)
-        for c in np.clip(
-            cspace_convert(quantizer.cluster_centers_, "CAM02-UCS", "sRGB1"), 0, 1
+    compressed_colorfulness = np.hypot(cam02ucs_colors[:, 1], cam02ucs_colors[:, 2])
+    return cam02ucs_colors[compressed_colorfulness > min_compressed_colorfulness]
+
+
+def color_sample_from_colors(
+    color_array, n_swatches=5, max_sample_size=20000, color_scale=1.0, min_chroma=20
+):
+    # sklearn.cluster is slow to import and only needed for colormaps
+    from sklearn.cluster import MiniBatchKMeans
+
+    if color_array.shape[0] > max_sample_size:
+        # A handful of representative swatches doesn't need every point; convert
+        # and cluster a fixed random subsample instead
+        sample_indices = np.random.default_rng(0).choice(
+            color_array.shape[0], max_sample_size, replace=False
         )
-    ]
+        color_array = color_array[sample_indices]
+    # Colours may be given on a 0-255 scale; rescale only the sampled colours
+    rgb_colors = color_array[:, :3] / color_scale
+    cielab_colors = cspace_convert(rgb_colors, "sRGB1", "CAM02-UCS")
+    if min_chroma is not None:
+        chromatic_colors = _chromatic_cam02ucs_colors(cielab_colors, min_chroma)
+        # Mostly greyscale data keeps its greys rather than losing swatches
+        if np.unique(chromatic_colors, axis=0).shape[0] >= n_swatches:
+            cielab_colors = chromatic_colors
+    distinct_colors = np.unique(cielab_colors, axis=0)
+    if distinct_colors.shape[0] == 0:
+        return []
+    elif distinct_colors.shape[0] <= n_swatches:
+        # Too few colours to cluster; they are their own swatches, repeated as
+        # needed so that there are always n_swatches of them
+        swatch_colors = distinct_colors[
+            np.arange(n_swatches) % distinct_colors.shape[0]
+        ]
+    else:
+        quantizer = MiniBatchKMeans(
+            n_clusters=n_swatches,
+            random_state=0,
+            n_init=1,
+            batch_size=4096,
+            max_iter=50,
+        ).fit(cielab_colors.astype(np.float32))
+        swatch_colors = quantizer.cluster_centers_
+    result = _rgb_array_to_hex(
+        np.clip(cspace_convert(swatch_colors, "CAM02-UCS", "sRGB1"), 0, 1)
+    )
     return result
 
 
+def _to_rgba_any(color):
+    """Convert either a matplotlib colour specification or an (r, g, b) tuple
+    of uint8 values to an RGBA tuple of floats."""
+    if type(color) == str:
+        return to_rgba(color)
+    else:
+        return (color[0] / 255, color[1] / 255, color[2] / 255, 1.0)
+
+
 def per_layer_cluster_colormaps(label_layers, label_color_map, n_swatches=5):
     metadata = []
     colordata = []
     for i, layer in enumerate(label_layers[::-1]):
-        color_list = pd.Series(layer).map(label_color_map).to_list()
-        color_array = np.asarray(
-            [
-                to_rgba(color)
-                if type(color) == str
-                else (color[0] / 255, color[1] / 255, color[2] / 255, 1.0)
-                for color in color_list
-            ]
+        # Convert colours once per label and gather, rather than once per point
+        unique_labels, label_indices = np.unique(layer, return_inverse=True)
+        label_palette = np.asarray(
+            [_to_rgba_any(label_color_map[label]) for label in unique_labels]
         )
+        color_array = label_palette[label_indices.ravel()]
         color_sample = color_sample_from_colors(color_array, n_swatches)
-        unique_labels = np.unique(layer)
+        unique_label_set = set(unique_labels)
         colormap_subset = {
-            label:
-                rgb2hex((color[0] / 255, color[1] / 255, color[2] / 255, 1.0))
-                if type(color) != str
-                else color
-            for label, color in label_color_map.items() if label in unique_labels
+            label: color
+            for label, color in label_color_map.items()
+            if label in unique_label_set
         }
+        uint8_color_labels = [
+            label for label, color in colormap_subset.items() if type(color) != str
+        ]
+        if len(uint8_color_labels) > 0:
+            uint8_colors = np.asarray(
+                [colormap_subset[label][:3] for label in uint8_color_labels]
+            )
+            colormap_subset.update(
+                zip(uint8_color_labels, _rgb_array_to_hex(uint8_colors / 255))
+            )
         descriptors = _CLUSTER_LAYER_DESCRIPTORS.get(
             len(label_layers), [f"Layer-{n}" for n in range(len(label_layers))]
         )
@@ -758,7 +979,7 @@ def build_colormap_data(colormap_rawdata, colormap_metadata, base_colors):
             "kind": "categorical",
         }
     ]
-    color_data = []
+    color_arrays = {}
 
     for rawdata, metadata in zip(colormap_rawdata, colormap_metadata):
         if "colors" in metadata:
@@ -787,25 +1008,83 @@ def build_colormap_data(colormap_rawdata, colormap_metadata, base_colors):
         if "color_mapping" in metadata:
             colormap["colorMapping"] = metadata["color_mapping"]
             colormap["kind"] = "categorical"
-            colors_array = (
-                np.array([to_rgba(metadata["color_mapping"][val]) for val in rawdata])
+            unique_values, value_indices = np.unique(rawdata, return_inverse=True)
+            value_palette = (
+                np.array(
+                    [to_rgba(metadata["color_mapping"][val]) for val in unique_values]
+                )
                 * 255
             ).astype(np.uint8)
+            colors_array = value_palette[value_indices.ravel()]
         else:
             colors_array = array_to_colors(rawdata, cmap_name, colormap, cmap_colors)
-        color_data.append(
-            pd.DataFrame(
-                colors_array,
-                columns=[
-                    f"{metadata['field']}_r",
-                    f"{metadata['field']}_g",
-                    f"{metadata['field']}_b",
-                    f"{metadata['field']}_a",
-                ],
-            )
-        )
+        color_arrays[metadata["field"]] = colors_array
+
+    # Build the column dict from views into the per-field arrays so the
+    # colour data is only materialized once, when the Arrow table is built.
+    # Fully opaque alpha channels carry no information and are restored
+    # on the JS side, so they are not shipped.
+    color_columns = {}
+    for field, colors_array in color_arrays.items():
+        for channel_idx, channel in enumerate("rgb"):
+            color_columns[f"{field}_{channel}"] = colors_array[:, channel_idx]
+        if not np.all(colors_array[:, 3] == 255):
+            color_columns[f"{field}_a"] = colors_array[:, 3]
+
+    return colormaps, pa.table(color_columns)
+
+
+@numba.njit(parallel=True)
+def _centroid_distances(points, centroid):
+    # Sum of fourth powers of the offsets; this orders points identically
+    # to the norm of the squared offset vectors, without the square root
+    result = np.empty(points.shape[0], dtype=np.float64)
+    for i in numba.prange(points.shape[0]):
+        distance = 0.0
+        for j in range(points.shape[1]):
+            diff = points[i, j] - centroid[j]
+            distance += (diff * diff) * (diff * diff)
+        result[i] = distance
+    return result
 
-    return colormaps, pd.concat(color_data, axis=1)
+
+@numba.njit()
+def _coordinate_extents(points):
+    # Per-dimension minima and maxima in a single sweep over the points, rather
+    # than one full pass for each reduction
+    if points.shape[0] == 0:
+        raise ValueError("Cannot compute the extents of an empty set of points")
+    # NaN coordinates fail both comparisons and so are skipped, as with nanmin
+    mins = np.full(points.shape[1], np.inf)
+    maxs = np.full(points.shape[1], -np.inf)
+    for i in range(points.shape[0]):
+        for j in range(points.shape[1]):
+            value = points[i, j]
+            if value < mins[j]:
+                mins[j] = value
+            if value > maxs[j]:
+                maxs[j] = value
+    for j in range(points.shape[1]):
+        if mins[j] > maxs[j]:
+            # Every coordinate in this dimension was NaN
+            mins[j] = np.nan
+            maxs[j] = np.nan
+    return mins, maxs
+
+
+@numba.njit()
+def _cluster_sums_and_counts(points, cluster_idx, n_clusters):
+    # Per-cluster coordinate sums (one row per dimension) and point counts in a
+    # single pass over the points; noise points (cluster index -1) are skipped
+    sums = np.zeros((points.shape[1], n_clusters), dtype=np.float64)
+    counts = np.zeros(n_clusters, dtype=np.int64)
+    for i in range(points.shape[0]):
+        cluster = cluster_idx[i]
+        if cluster >= 0:
+            counts[cluster] += 1
+            for j in range(points.shape[1]):
+                sums[j, cluster] += points[i, j]
+    return sums, counts
 
 
 def compute_percentile_bounds(points, percentage=99.9):
@@ -813,15 +1092,16 @@ def compute_percentile_bounds(points, percentage=99.9):
     n_to_select = np.int32(n_points * (percentage / 100))
     centroid = np.mean(points, axis=0)
 
-    # Sort points by distance from centroid
-    vectors = points - centroid
-    distances = np.linalg.norm(vectors**2, axis=1)
-    sorted_indices = np.argsort(distances)
-    selected_points = points[sorted_indices[:n_to_select]]
+    # Select the points closest to the centroid; only the selected set matters,
+    # so a partition suffices where a full sort was used before
+    distances = _centroid_distances(points, centroid)
+    if n_to_select < n_points:
+        selected_points = points[np.argpartition(distances, n_to_select)[:n_to_select]]
+    else:
+        selected_points = points
 
     # Compute bounds
-    xmin, ymin = np.min(selected_points, axis=0)
-    xmax, ymax = np.max(selected_points, axis=0)
+    (xmin, ymin), (xmax, ymax) = _coordinate_extents(selected_points)
 
     x_padding = 0.01 * (xmax - xmin)
     y_padding = 0.01 * (ymax - ymin)
@@ -834,6 +1114,17 @@ def compute_percentile_bounds(points, percentage=99.9):
     ]
 
 
+def _cluster_boundary_polygons(cluster_points, alpha):
+    simplices = delaunay_simplices(cluster_points)
+    # Keep polygons as arrays rather than nested lists of Python floats;
+    # they are only ever serialized to JSON, which handles arrays directly.
+    # Single precision is all the page renders with, and keeps the JSON compact
+    return [
+        smooth_polygon(x).astype(np.float32)
+        for x in create_boundary_polygons(cluster_points, simplices, alpha=alpha)
+    ]
+
+
 def label_text_and_polygon_dataframes(
     labels,
     data_map_coords,
@@ -843,70 +1134,151 @@ def label_text_and_polygon_dataframes(
     alpha=0.05,
 ):
     cluster_label_vector = np.asarray(labels)
-    unique_non_noise_labels = [
-        label for label in np.unique(cluster_label_vector) if label != noise_label
-    ]
-    label_map = {n: i for i, n in enumerate(unique_non_noise_labels)}
-    label_map[noise_label] = -1
-    cluster_idx_vector = np.asarray(pd.Series(cluster_label_vector).map(label_map))
-
-    label_locations = []
-    cluster_sizes = []
-    polygons = []
+    unique_labels, label_indices = np.unique(
+        cluster_label_vector, return_inverse=True
+    )
+    noise_mask = np.array([label == noise_label for label in unique_labels], dtype=bool)
+    unique_non_noise_labels = unique_labels[~noise_mask]
+    # Map unique label positions to contiguous cluster indices, with noise as -1;
+    # int32 halves the memory traffic of the grouping passes over the indices
+    label_remap = np.cumsum(~noise_mask, dtype=np.int32) - 1
+    label_remap[noise_mask] = -1
+    cluster_idx_vector = label_remap[label_indices.ravel()]
+
+    n_clusters = len(unique_non_noise_labels)
+    coordinate_sums, cluster_counts = _cluster_sums_and_counts(
+        data_map_coords, cluster_idx_vector, n_clusters
+    )
+    cluster_sizes = cluster_counts**0.25
 
-    for i, _ in enumerate(unique_non_noise_labels):
-        cluster_mask = cluster_idx_vector == i
-        cluster_points = data_map_coords[cluster_mask]
+    if not use_medoids:
+        label_locations = (coordinate_sums / cluster_counts).astype(
+            np.result_type(data_map_coords.dtype, np.float16), copy=False
+        )
+    if cluster_polygons:
+        polygons = np.empty(n_clusters, dtype=object)
+
+    if use_medoids or cluster_polygons:
+        # Group point indices by cluster once so that each cluster is a contiguous
+        # slice; a stable sort keeps points in their original order within a cluster
+        cluster_order = np.argsort(cluster_idx_vector, kind="stable")
+        cluster_bounds = np.searchsorted(
+            cluster_idx_vector[cluster_order], np.arange(n_clusters + 1)
+        )
+        grouped_coords = data_map_coords[cluster_order]
         if use_medoids:
-            label_locations.append(medoid(cluster_points))
-        else:
-            label_locations.append(cluster_points.mean(axis=0))
+            label_locations = np.ascontiguousarray(
+                medoids(grouped_coords, cluster_bounds).T
+            )
 
-        cluster_sizes.append(np.sum(cluster_mask) ** 0.25)
         if cluster_polygons:
-            simplices = Delaunay(
-                cluster_points, qhull_options="Qbb Qc Qz Q12 Q7"
-            ).simplices
-            polygons.append(
-                [
-                    smooth_polygon(x).tolist()
-                    for x in create_boundary_polygons(
-                        cluster_points, simplices, alpha=alpha
+            cluster_point_sets = [
+                grouped_coords[cluster_bounds[i] : cluster_bounds[i + 1]]
+                for i in range(n_clusters)
+            ]
+            # Clusters are independent and the compiled geometry releases the GIL,
+            # so spread the work over threads when there are enough clusters
+            if n_clusters > 32:
+                with ThreadPoolExecutor() as executor:
+                    cluster_polygon_lists = list(
+                        executor.map(
+                            lambda points: _cluster_boundary_polygons(points, alpha),
+                            cluster_point_sets,
+                        )
                     )
+            else:
+                cluster_polygon_lists = [
+                    _cluster_boundary_polygons(points, alpha)
+                    for points in cluster_point_sets
                 ]
-            )
-
-    label_locations = np.asarray(label_locations)
+            for i, cluster_polygon_list in enumerate(cluster_polygon_lists):
+                polygons[i] = cluster_polygon_list
 
     data = {
-        "x": label_locations.T[0],
-        "y": label_locations.T[1],
+        "x": label_locations[0],
+        "y": label_locations[1],
         "label": unique_non_noise_labels,
         "size": cluster_sizes,
     }
     if cluster_polygons:
         data["polygon"] = polygons
 
-    return pd.DataFrame(data)
+    return pd.DataFrame(data, copy=False)
+
+
+@functools.lru_cache(maxsize=128)
+def _download_base64_img(url):
+    # Download the image
+    response = requests.get(url, timeout=10)
+    response.raise_for_status()
+
+    # Determine the image type from the Content-Type header
+    content_type = response.headers.get('Content-Type', '')
+    if not content_type.startswith('image/'):
+        raise ValueError(f'URL does not point to an image (Content-Type: {content_type})')
+
+    # Convert the image data to base64; the output is pure ASCII, so decode it as
+    # such rather than going through the more general UTF-8 decoder
+    image_data = b64encode(memoryview(response.content)).decode('ascii')
+
+    # Create the complete data URL
+    return f'data:{content_type};base64,{image_data}'
+
+
+def _json_bytes(obj):
+    # Serialize to UTF-8 encoded JSON, using orjson if it is available and can
+    # handle the data, and the standard library otherwise
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            pass
+    return json.dumps(obj).encode()
+
+
+def _base64_table(table):
+    # Base64 encode an Arrow table as uncompressed feather; packed float32 and
+    # uint8 point columns shrink by only ~20% under gzip, which isn't worth the
+    # time it takes to compress (and decompress) them
+    sink = pa.BufferOutputStream()
+    feather.write_feather(table, sink, compression="uncompressed")
+    return b64encode(sink.getvalue()).decode("ascii")
+
+
+def _records_json(dataframe):
+    # Serialize a dataframe as UTF-8 encoded JSON records. With orjson, numpy
+    # values (including the potentially large polygon arrays) are written
+    # directly at their own precision, without building pandas' intermediate str
+    if orjson is not None:
+        columns = [dataframe[name].to_numpy() for name in dataframe.columns]
+        records = [dict(zip(dataframe.columns, row)) for row in zip(*columns)]
+        try:
+            return orjson.dumps(records, option=orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            pass
+    return dataframe.to_json(orient="records").encode()
+
+
+def _gzip_base64(payload):
+    # Compress a payload (an Arrow table or serialized bytes) and base64 encode it
+    # for inlining in the page; tables are written straight into the compressor,
+    # so no uncompressed copy of them is ever materialized
+    buffer = io.BytesIO()
+    with gzip.GzipFile(
+        fileobj=buffer, mode="wb", compresslevel=_GZIP_COMPRESSLEVEL
+    ) as f:
+        if isinstance(payload, pa.Table):
+            feather.write_feather(payload, f, compression="uncompressed")
+        else:
+            f.write(payload)
+    return b64encode(buffer.getbuffer()).decode("ascii")
 
 
 def url_to_base64_img(url):
+    # Successful downloads are cached, so repeated renders with the same image
+    # don't download it again; failures are not cached and will be retried
     try:
-        # Download the image
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        
-        # Determine the image type from the Content-Type header
-        content_type = response.headers.get('Content-Type', '')
-        if not content_type.startswith('image/'):
-            raise ValueError(f'URL does not point to an image (Content-Type: {content_type})')
-            
-        # Convert the image data to base64
-        image_data = base64.b64encode(response.content).decode('utf-8')
-        
-        # Create the complete data URL
-        return f'data:{content_type};base64,{image_data}'
-        
+        return _download_base64_img(url)
     except requests.RequestException as e:
         print(f"Error downloading image: {e}")
         return None
@@ -1299,14 +1671,16 @@ def render_html(
     if point_size_scale is not None:
         magic_number = point_size_scale / 100.0
     else:
-        magic_number = np.clip(32 * 4 ** (-np.log10(n_points)), 0.005, 0.1)
+        magic_number = min(max(32 * 4 ** (-math.log10(n_points)), 0.005), 0.1)
 
     if "size" not in point_dataframe.columns:
         point_size = magic_number
     else:
-        point_dataframe["size"] = magic_number * (
-            point_dataframe["size"] / point_dataframe["size"].mean()
-        )
+        # Rescale in a float32 copy (sizes need no more precision than that, and
+        # copying ensures we never write through to a caller's array)
+        sizes = point_dataframe["size"].to_numpy(dtype=np.float32, copy=True)
+        sizes *= magic_number / sizes.mean(dtype=np.float64)
+        point_dataframe["size"] = sizes
         point_size = -1
 
     # Compute bounds for initial view
@@ -1320,12 +1694,9 @@ def render_html(
 
     if background_image is not None:
         if background_image_bounds is None:
-            background_image_bounds = [
-                point_dataframe["x"].min(),
-                point_dataframe["y"].min(),
-                point_dataframe["x"].max(),
-                point_dataframe["y"].max(),
-            ]
+            # [xmin, ymin, xmax, ymax] as plain floats for the template
+            mins, maxs = _coordinate_extents(point_dataframe[["x", "y"]].to_numpy())
+            background_image_bounds = np.concatenate((mins, maxs)).tolist()
 
     point_outline_color = [250, 250, 250, 128] if not darkmode else [5, 5, 5, 128]
     text_background_color = [255, 255, 255, 64] if not darkmode else [0, 0, 0, 64]
@@ -1335,13 +1706,16 @@ def render_html(
         label_text_color = [0, 0, 0, 255] if not darkmode else [255, 255, 255, 255]
 
     # Compute text scaling
-    size_range = label_dataframe["size"].max() - label_dataframe["size"].min()
+    label_sizes = label_dataframe["size"].to_numpy(dtype=np.float64, copy=True)
+    min_label_size = label_sizes.min(initial=np.inf)
+    size_range = label_sizes.max(initial=-np.inf) - min_label_size
     if size_range > 0:
-        label_dataframe["size"] = (
-            label_dataframe["size"] - label_dataframe["size"].min()
-        ) * ((max_fontsize - min_fontsize) / size_range) + min_fontsize
+        label_sizes -= min_label_size
+        label_sizes *= (max_fontsize - min_fontsize) / size_range
+        label_sizes += min_fontsize
     else:
-        label_dataframe["size"] = (max_fontsize + min_fontsize) / 2.0
+        label_sizes.fill((max_fontsize + min_fontsize) / 2.0)
+    label_dataframe["size"] = label_sizes
 
     # Prep data for inlining or storage
     enable_histogram = histogram_data is not None
@@ -1362,66 +1736,48 @@ def render_html(
     #     point_dataframe["selected"] = np.ones(len(point_dataframe), dtype=np.uint8)
     #     point_data_cols.append("selected")
 
-    point_data = point_dataframe[point_data_cols]
-
-    if "hover_text" in point_dataframe.columns:
-        if extra_point_data is not None:
-            hover_data = pd.concat(
-                [point_dataframe[["hover_text"]], extra_point_data],
-                axis=1,
-            )
-            replacements = FormattingDict(
-                **{
-                    str(name): f"${{hoverData.{name}[index]}}"
-                    for name in hover_data.columns
-                }
-            )
-            if hover_text_html_template is not None:
-                get_tooltip = (
-                    '({index, picked}) => picked ? {"html": `'
-                    + hover_text_html_template.format_map(replacements)
-                    + "`} : null"
-                )
-            else:
-                get_tooltip = "({index}) => hoverData.hover_text[index]"
-
-            if on_click is not None:
-                on_click = (
-                    "({index, picked}, event) => { if (picked) {"
-                    + on_click.format_map(replacements)
-                    + " } }"
-                )
-        else:
-            hover_data = point_dataframe[["hover_text"]].copy()
-            get_tooltip = "({index}) => hoverData.hover_text[index]"
-
-            replacements = FormattingDict(
-                **{
-                    str(name): f"${{hoverData.{name}[index]}}"
-                    for name in hover_data.columns
-                }
+    # The page only needs 32-bit coordinates and sizes and 8-bit colour channels;
+    # downcasting halves (or better) the payload that has to be encoded and shipped.
+    # Build the Arrow table straight from the numpy columns, without an
+    # intermediate DataFrame; chunks are then zero-copy slices of it
+    point_table = pa.table(
+        {
+            col: point_dataframe[col].to_numpy(
+                dtype=np.uint8 if col in ("r", "g", "b", "a") else np.float32
             )
+            for col in point_data_cols
+        }
+    )
 
-            if on_click is not None:
-                on_click = (
-                    "({index, picked}, event) => { if (picked) {"
-                    + on_click.format_map(replacements)
-                    + " } }"
-                )
+    # hover_data is only ever read from below, so it needs no defensive copies
+    has_hover_text = "hover_text" in point_dataframe.columns
+    if has_hover_text and extra_point_data is not None:
+        hover_data = pd.concat(
+            [point_dataframe[["hover_text"]], extra_point_data],
+            axis=1,
+        )
+    elif has_hover_text:
+        hover_data = point_dataframe[["hover_text"]]
     elif extra_point_data is not None:
-        hover_data = extra_point_data.copy()
+        hover_data = extra_point_data
+    else:
+        hover_data = pd.DataFrame(columns=("hover_text",))
+
+    if has_hover_text or extra_point_data is not None:
         replacements = FormattingDict(
             **{
                 str(name): f"${{hoverData.{name}[index]}}"
                 for name in hover_data.columns
             }
         )
-        if hover_text_html_template is not None:
+        if hover_text_html_template is not None and extra_point_data is not None:
             get_tooltip = (
                 '({index, picked}) => picked ? {"html": `'
                 + hover_text_html_template.format_map(replacements)
                 + "`} : null"
             )
+        elif has_hover_text:
+            get_tooltip = "({index}) => hoverData.hover_text[index]"
         else:
             get_tooltip = "null"
 
@@ -1432,7 +1788,6 @@ def render_html(
                 + " } }"
             )
     else:
-        hover_data = pd.DataFrame(columns=("hover_text",))
         get_tooltip = "null"
 
     if enable_histogram:
@@ -1459,24 +1814,12 @@ def render_html(
             )
 
     if colormap_rawdata is not None and colormap_metadata is not None:
-        jch_colors = cspace_convert(
-            point_dataframe[["r", "g", "b"]].values / 255, "sRGB1", "JCh"
-        )
-        cielab_colors = cspace_convert(
-            jch_colors[jch_colors.T[1] > 20], "JCh", "CAM02-UCS"
-        )
         n_swatches = np.max(
             [colormap.get("n_colors", 5) for colormap in colormap_metadata]
         ) if len(colormap_metadata) > 0 else 5
-        quantizer = KMeans(n_clusters=n_swatches, random_state=0, n_init=1).fit(
-            cielab_colors
+        cluster_colors = color_sample_from_colors(
+            point_dataframe[["r", "g", "b"]].to_numpy(), n_swatches, color_scale=255
         )
-        cluster_colors = [
-            rgb2hex(c)
-            for c in np.clip(
-                cspace_convert(quantizer.cluster_centers_, "CAM02-UCS", "sRGB1"), 0, 1
-            )
-        ]
         if cluster_layer_colormaps:
             if label_layers is None or cluster_colormap is None:
                 raise ValueError(
@@ -1494,16 +1837,12 @@ def render_html(
     elif colormaps is not None:
         colormap_metadata = default_colormap_options(colormaps)
         colormap_rawdata = list(colormaps.values())
-        cielab_colors = cspace_convert(
-            point_dataframe[["r", "g", "b"]].values / 255, "sRGB1", "CAM02-UCS"
+        cluster_colors = color_sample_from_colors(
+            point_dataframe[["r", "g", "b"]].to_numpy(),
+            5,
+            color_scale=255,
+            min_chroma=None,
         )
-        quantizer = KMeans(n_clusters=5, random_state=0, n_init=1).fit(cielab_colors)
-        cluster_colors = [
-            rgb2hex(c)
-            for c in np.clip(
-                cspace_convert(quantizer.cluster_centers_, "CAM02-UCS", "sRGB1"), 0, 1
-            )
-        ]
         if cluster_layer_colormaps:
             if label_layers is None or cluster_colormap is None:
                 raise ValueError(
@@ -1523,44 +1862,47 @@ def render_html(
         color_data = None
         enable_colormap_selector = False
 
+    # Convert the hover data to Arrow too, though it is still shipped as JSON
+    # columns; Arrow's to_pydict is far cheaper than pandas' to_dict. Columns of
+    # mixed python objects can't be converted to Arrow, so fall back to pandas.
+    try:
+        hover_table = pa.Table.from_pandas(hover_data, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        hover_table = None
+
+    def hover_data_json(start, end):
+        if hover_table is not None:
+            return _json_bytes(hover_table.slice(start, end - start).to_pydict())
+        return _json_bytes(hover_data[start:end].to_dict(orient="list"))
+
     if inline_data:
-        buffer = io.BytesIO()
-        point_data.to_feather(buffer, compression="uncompressed")
-        buffer.seek(0)
-        arrow_bytes = buffer.read()
-        gzipped_bytes = gzip.compress(arrow_bytes)
-        base64_point_data = base64.b64encode(gzipped_bytes).decode()
-        json_bytes = json.dumps(hover_data.to_dict(orient="list")).encode()
-        gzipped_bytes = gzip.compress(json_bytes)
-        base64_hover_data = base64.b64encode(gzipped_bytes).decode()
-        label_data_json = label_dataframe.to_json(orient="records")
-        gzipped_label_data = gzip.compress(bytes(label_data_json, "utf-8"))
-        base64_label_data = base64.b64encode(gzipped_label_data).decode()
+        # Compress and encode the payloads concurrently; they are independent,
+        # and zlib releases the GIL while compressing
+        payloads = {
+            "hover": hover_data_json(0, hover_data.shape[0]),
+            "label": _records_json(label_dataframe),
+        }
         if enable_histogram:
-            json_bytes = bin_data.to_json(
+            payloads["histogram_bin"] = bin_data.to_json(
                 orient="records", date_format="iso", date_unit="s"
             ).encode()
-            gzipped_bytes = gzip.compress(json_bytes)
-            base64_histogram_bin_data = base64.b64encode(gzipped_bytes).decode()
-            buffer = io.BytesIO()
-            index_data.to_frame().to_feather(buffer, compression="uncompressed")
-            buffer.seek(0)
-            arrow_bytes = buffer.read()
-            gzipped_bytes = gzip.compress(arrow_bytes)
-            base64_histogram_index_data = base64.b64encode(gzipped_bytes).decode()
-        else:
-            base64_histogram_bin_data = None
-            base64_histogram_index_data = None
-
+            payloads["histogram_index"] = pa.Table.from_pandas(
+                index_data.to_frame(), preserve_index=False
+            )
         if enable_colormap_selector:
-            buffer = io.BytesIO()
-            color_data.to_feather(buffer, compression="uncompressed")
-            buffer.seek(0)
-            arrow_bytes = buffer.read()
-            gzipped_bytes = gzip.compress(arrow_bytes)
-            base64_color_data = base64.b64encode(gzipped_bytes).decode()
-        else:
-            base64_color_data = None
+            payloads["color"] = color_data
+
+        with ThreadPoolExecutor(max_workers=len(payloads) + 1) as executor:
+            point_future = executor.submit(_base64_table, point_table)
+            encoded = dict(
+                zip(payloads, executor.map(_gzip_base64, payloads.values()))
+            )
+            base64_point_data = point_future.result()
+        base64_hover_data = encoded["hover"]
+        base64_label_data = encoded["label"]
+        base64_histogram_bin_data = encoded.get("histogram_bin")
+        base64_histogram_index_data = encoded.get("histogram_index")
+        base64_color_data = encoded.get("color")
 
         file_prefix = None
         n_chunks = 0
@@ -1574,36 +1916,65 @@ def render_html(
         file_prefix = (
             offline_data_prefix if offline_data_prefix is not None else "datamapplot"
         )
-        n_chunks = (point_data.shape[0] // offline_data_chunk_size) + 1
-        for i in range(n_chunks):
+        n_chunks = (point_table.num_rows // offline_data_chunk_size) + 1
+
+        def write_arrow_stream(table, filename):
+            # Arrow data goes in a single IPC stream, with one record batch per
+            # chunk, so the schema is written once rather than once per chunk
+            with gzip.open(filename, "wb", compresslevel=_GZIP_COMPRESSLEVEL) as f:
+                with pa.ipc.new_stream(f, table.schema) as writer:
+                    writer.write_table(table, max_chunksize=offline_data_chunk_size)
+
+        def write_meta_data_chunk(i):
             chunk_start = i * offline_data_chunk_size
-            chunk_end = min((i + 1) * offline_data_chunk_size, point_data.shape[0])
-            with gzip.open(f"{file_prefix}_point_data_{i}.zip", "wb") as f:
-                point_data[chunk_start:chunk_end].to_feather(
-                    f, compression="uncompressed"
-                )
-            with gzip.open(f"{file_prefix}_meta_data_{i}.zip", "wb") as f:
-                f.write(
-                    json.dumps(
-                        hover_data[chunk_start:chunk_end].to_dict(orient="list")
-                    ).encode()
+            chunk_end = min((i + 1) * offline_data_chunk_size, point_table.num_rows)
+            with gzip.open(
+                f"{file_prefix}_meta_data_{i}.zip",
+                "wb",
+                compresslevel=_GZIP_COMPRESSLEVEL,
+            ) as f:
+                f.write(hover_data_json(chunk_start, chunk_end))
+
+        # Files are independent, and zlib releases the GIL while compressing,
+        # so write them from a pool of threads
+        with ThreadPoolExecutor() as executor:
+            futures = [
+                executor.submit(
+                    write_arrow_stream, point_table, f"{file_prefix}_point_data.zip"
                 )
+            ]
             if enable_colormap_selector:
-                with gzip.open(f"{file_prefix}_color_data_{i}.zip", "wb") as f:
-                    color_data[chunk_start:chunk_end].to_feather(
-                        f, compression="uncompressed"
+                futures.append(
+                    executor.submit(
+                        write_arrow_stream, color_data, f"{file_prefix}_color_data.zip"
                     )
-        label_data_json = label_dataframe.to_json(path_or_buf=None, orient="records")
-        with gzip.open(f"{file_prefix}_label_data.zip", "wb") as f:
-            f.write(bytes(label_data_json, "utf-8"))
+                )
+            futures.extend(
+                executor.submit(write_meta_data_chunk, i) for i in range(n_chunks)
+            )
+            for future in futures:
+                future.result()
+
+        with gzip.open(
+            f"{file_prefix}_label_data.zip", "wb", compresslevel=_GZIP_COMPRESSLEVEL
+        ) as f:
+            f.write(_records_json(label_dataframe))
         if enable_histogram:
-            with gzip.open(f"{file_prefix}_histogram_bin_data.zip", "wb") as f:
+            with gzip.open(
+                f"{file_prefix}_histogram_bin_data.zip",
+                "wb",
+                compresslevel=_GZIP_COMPRESSLEVEL,
+            ) as f:
                 f.write(
                     bin_data.to_json(
                         orient="records", date_format="iso", date_unit="s"
                     ).encode()
                 )
-            with gzip.open(f"{file_prefix}_histogram_index_data.zip", "wb") as f:
+            with gzip.open(
+                f"{file_prefix}_histogram_index_data.zip",
+                "wb",
+                compresslevel=_GZIP_COMPRESSLEVEL,
+            ) as f:
                 index_data.to_frame().to_feather(f, compression="uncompressed")
 
     title_font_color = "#000000" if not darkmode else "#ffffff"
@@ -1614,7 +1985,7 @@ def render_html(
     input_border = "#ddddddff" if not darkmode else "222222ff"
 
     if tooltip_css is None:
-        tooltip_css_template = jinja2.Template(_TOOL_TIP_CSS)
+        tooltip_css_template = _compiled_template(_TOOL_TIP_CSS)
         tooltip_css = tooltip_css_template.render(
             title_font_family=tooltip_font_family or font_family,
             title_font_color=title_font_color,
@@ -1648,7 +2019,7 @@ def render_html(
         ),
     }
 
-    template = jinja2.Template(_DECKGL_TEMPLATE_STR)
+    template = _compiled_template(_DECKGL_TEMPLATE_STR)
 
     if offline_mode:
         if offline_mode_js_data_file is None:
@@ -1658,9 +2029,7 @@ def render_html(
             )
             if not offline_mode_js_data_file.is_file():
                 offline_mode_caching.cache_js_files()
-            offline_mode_data = json.load(offline_mode_js_data_file.open("r"))
-        else:
-            offline_mode_data = json.load(open(offline_mode_js_data_file, "r"))
+        offline_mode_data = _load_offline_data_file(offline_mode_js_data_file)
 
         if offline_mode_font_data_file is None:
             data_directory = platformdirs.user_data_dir("datamapplot")
@@ -1670,26 +2039,37 @@ def render_html(
             if not offline_mode_font_data_file.is_file():
                 offline_mode_caching.cache_fonts()
 
-        if logo is not None:
-            logo = url_to_base64_img(logo)
-
     else:
         offline_mode_data = None
 
-    api_fontname = font_family.replace(" ", "+")
-    font_data = get_google_font_for_embedding(font_family, offline_mode=offline_mode)
-    if font_data == "":
-        api_fontname = None
-    if tooltip_font_family is not None:
-        api_tooltip_fontname = tooltip_font_family.replace(" ", "+")
-        resp = requests.get(
-            f"https://fonts.googleapis.com/css?family={api_tooltip_fontname}",
-            timeout=30,
+    # Font and image requests are I/O bound, so fetch the label and tooltip fonts,
+    # and any logo to embed, concurrently
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        if offline_mode and logo is not None:
+            logo_future = executor.submit(url_to_base64_img, logo)
+        font_data_future = executor.submit(
+            get_google_font_for_embedding,
+            font_family,
+            offline_mode=offline_mode,
+            offline_font_file=offline_mode_font_data_file,
         )
-        if not resp.ok:
+        # Offline pages can't load the tooltip font from Google anyway
+        check_tooltip_font = tooltip_font_family is not None and not offline_mode
+        if check_tooltip_font:
+            tooltip_font_future = executor.submit(
+                _tooltip_font_is_available, tooltip_font_family
+            )
+
+        api_fontname = font_family.replace(" ", "+")
+        font_data = font_data_future.result()
+        if font_data == "":
+            api_fontname = None
+        if check_tooltip_font and tooltip_font_future.result():
+            api_tooltip_fontname = tooltip_font_family.replace(" ", "+")
+        else:
             api_tooltip_fontname = None
-    else:
-        api_tooltip_fontname = None
+        if offline_mode and logo is not None:
+            logo = logo_future.result()
 
     if selection_handler is not None:
         if isinstance(selection_handler, Iterable):
@@ -56,6 +56,19 @@ def chunked_parallel_pairwise_distances(X, Y=None, metric=euclidean, chunk_size=
     return result
 
 
+@numba.njit(parallel=True, nogil=True)
+def distance_sums(X, Y, metric=euclidean):
+    # Row sums of the pairwise distance matrix between X and Y, accumulated
+    # directly rather than materializing the full matrix and then reducing it
+    result = np.empty(X.shape[0], dtype=np.float32)
+    for i in numba.prange(X.shape[0]):
+        total = 0.0
+        for j in range(Y.shape[0]):
+            total += metric(X[i], Y[j])
+        result[i] = total
+    return result
+
+
 @numba.njit()
 def pull_arms(data, arms, num_pulls_per_arm, estimates, pull_counts):
     other_candidates = np.random.choice(
@@ -64,12 +77,8 @@ def pull_arms(data, arms, num_pulls_per_arm, estimates, pull_counts):
     data_arm = data[arms]
     data_other = data[other_candidates]
 
-    distance_sums = np.sum(
-        chunked_parallel_pairwise_distances(data_arm, data_other), axis=1
-    )
-
     estimates *= pull_counts
-    estimates += distance_sums
+    estimates += distance_sums(data_arm, data_other)
     pull_counts += num_pulls_per_arm
     estimates /= pull_counts
 
@@ -110,6 +119,22 @@ def medoid(data, max_points=5000, max_iter=1000, arm_budget=20):
 
     if current_active_arms.shape[0] > 1:
         # if there are multiple arms left, return the one with the smallest estimate
-        return data[current_active_arms[np.argmin(estimates[current_active_arms])]]
+        return data[current_active_arms[np.argmin(estimates)]]
     else:
         return data[current_active_arms[0]]
+
+
+@numba.njit()
+def medoids(data, offsets, max_points=5000, max_iter=1000, arm_budget=20):
+    # medoids of each of the contiguous groups data[offsets[i]:offsets[i + 1]];
+    # each medoid computation is already parallel internally, so groups are
+    # processed in sequence rather than with a (nested) prange
+    result = np.empty((offsets.shape[0] - 1, data.shape[1]), dtype=data.dtype)
+    for i in range(offsets.shape[0] - 1):
+        result[i] = medoid(
+            data[offsets[i] : offsets[i + 1]],
+            max_points=max_points,
+            max_iter=max_iter,
+            arm_budget=arm_budget,
+        )
+    return result
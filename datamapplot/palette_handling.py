@@ -15,10 +15,8 @@ def palette_from_datamap(
     if label_locations.shape[0] == 0:
         return []
 
-    data_center = np.asarray(
-        umap_coords.min(axis=0)
-        + (umap_coords.max(axis=0) - umap_coords.min(axis=0)) / 2
-    )
+    data_min = umap_coords.min(axis=0)
+    data_center = np.asarray(data_min + (umap_coords.max(axis=0) - data_min) / 2)
     centered_data = umap_coords - data_center
     data_map_radii = np.linalg.norm(centered_data, axis=1)
     data_map_thetas = np.arctan2(centered_data.T[1], centered_data.T[0])
@@ -163,10 +161,8 @@ def palette_from_cmap_and_datamap(
         )
         cyclic_cmap = ListedColormap(new_colors, name="generated_cyclic_cmap")
 
-    data_center = np.asarray(
-        umap_coords.min(axis=0)
-        + (umap_coords.max(axis=0) - umap_coords.min(axis=0)) / 2
-    )
+    data_min = umap_coords.min(axis=0)
+    data_center = np.asarray(data_min + (umap_coords.max(axis=0) - data_min) / 2)
     centered_data = umap_coords - data_center
     data_map_radii = np.linalg.norm(centered_data, axis=1)
     data_map_thetas = np.arctan2(centered_data.T[1], centered_data.T[0])
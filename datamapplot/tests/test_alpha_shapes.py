@@ -0,0 +1,49 @@
+import numpy as np
+from scipy.spatial import Delaunay
+
+from ..alpha_shapes import (
+    boundary_from_candidates,
+    build_polygons,
+    delaunay_simplices,
+    find_boundary_candidates,
+    sweep_hull_triangulation,
+)
+
+
+def _triangle_set(simplices):
+    return set(map(tuple, np.sort(simplices, axis=1)))
+
+
+def test_sweep_hull_matches_qhull():
+    rng = np.random.default_rng(0)
+    points = rng.normal(size=(2000, 2)).astype(np.float32)
+    simplices, consistent = sweep_hull_triangulation(points.astype(np.float64))
+    expected = Delaunay(points, qhull_options="Qbb Qc Qz Q12 Q7").simplices
+    assert consistent
+    assert _triangle_set(simplices) == _triangle_set(expected)
+
+
+def test_delaunay_simplices_degenerate_input_falls_back():
+    points = np.array([[0.0, 0.0], [1.0, 1.0], [2.0, 2.0], [1.0, 0.0]])
+    simplices, consistent = sweep_hull_triangulation(points[:3])
+    assert not consistent
+    assert _triangle_set(delaunay_simplices(points)) == _triangle_set(
+        Delaunay(points, qhull_options="Qbb Qc Qz Q12 Q7").simplices
+    )
+
+
+def test_build_polygons_uses_each_boundary_edge_once():
+    rng = np.random.default_rng(0)
+    points = rng.normal(size=(5000, 2)).astype(np.float32)
+    simplices = np.sort(delaunay_simplices(points), axis=1)
+    candidates = find_boundary_candidates(points, simplices, alpha=0.1)
+    boundary = boundary_from_candidates(candidates, points.shape[0])
+    sequences, offsets = build_polygons(boundary, points.shape[0])
+    walked = []
+    for start, end in zip(offsets[:-1], offsets[1:]):
+        sequence = sequences[start:end]
+        assert sequence[0] == sequence[-1]
+        walked.extend(zip(sequence[:-1], sequence[1:]))
+    walked = np.sort(np.array(walked), axis=1)
+    assert len(walked) == len(boundary)
+    assert set(map(tuple, walked)) == set(map(tuple, boundary))
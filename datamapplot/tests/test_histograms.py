@@ -0,0 +1,27 @@
+import numpy as np
+import pandas as pd
+
+from ..histograms import (
+    generate_bins_from_numeric_data,
+    generate_bins_from_categorical_data,
+)
+
+
+def test_numeric_bins_partition_data():
+    rng = np.random.default_rng(0)
+    data = pd.Series(rng.normal(size=1000))
+    bin_data, bin_ids = generate_bins_from_numeric_data(data, 10)
+    assert len(bin_data) == 10
+    assert bin_data["count"].sum() == 1000
+    for bin_id, count, indices in bin_data[["id", "count", "indices"]].values:
+        assert len(indices) == count
+        assert np.all(bin_ids[indices] == bin_id)
+
+
+def test_categorical_bins_group_rare_values():
+    data = pd.Series(["a"] * 5 + ["b"] * 3 + ["c", "d", None])
+    bin_data, bin_ids = generate_bins_from_categorical_data(data, 3)
+    assert bin_data["label"].tolist() == ["Other", "a", "b"]
+    assert bin_data["count"].tolist() == [2, 5, 3]
+    assert bin_data["indices"].tolist() == [[8, 9, 10], [0, 1, 2, 3, 4], [5, 6, 7]]
+    assert bin_ids.tolist() == [1] * 5 + [2] * 3 + [0] * 3
@@ -0,0 +1,112 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+import requests
+
+from ..interactive_rendering import (
+    InteractiveFigure,
+    build_colormap_data,
+    color_sample_from_colors,
+    get_google_font_for_embedding,
+    _coordinate_extents,
+    _replace_delimited,
+)
+
+
+@pytest.fixture
+def colormap_inputs():
+    rng = np.random.default_rng(42)
+    rawdata = [
+        rng.normal(size=100),
+        rng.choice(["a", "b", "c"], size=100),
+    ]
+    metadata = [
+        {"field": "value", "description": "A value", "cmap": "viridis"},
+        {
+            "field": "category",
+            "description": "A category",
+            "kind": "categorical",
+            "cmap": "tab10",
+        },
+    ]
+    return rawdata, metadata
+
+
+def test_build_colormap_data_columns(colormap_inputs):
+    rawdata, metadata = colormap_inputs
+    colormaps, color_data = build_colormap_data(rawdata, metadata, ["#000000"])
+    assert len(colormaps) == 3
+    # Fully opaque alpha channels are dropped
+    assert color_data.column_names == [
+        f"{field}_{channel}"
+        for field in ("value", "category")
+        for channel in "rgb"
+    ]
+    assert color_data.num_rows == 100
+    assert all(column.type == pa.uint8() for column in color_data.columns)
+
+
+def test_replace_delimited():
+    text = "a <start>x</end> b <start>y\nz</end> c <start>unterminated"
+    assert (
+        _replace_delimited(text, "<start>", "</end>", "R")
+        == "a R b R c <start>unterminated"
+    )
+
+
+def test_repr_html_defaults_to_srcdoc():
+    figure = InteractiveFigure("<html><script>const x = 1;</script></html>")
+    iframe = figure._repr_html_()
+    assert "srcdoc=" in iframe
+    assert "<script>" not in iframe
+
+
+def test_build_colormap_data_keeps_informative_alpha(colormap_inputs):
+    rawdata, metadata = colormap_inputs
+    rawdata[0][:10] = np.nan
+    colormaps, color_data = build_colormap_data(rawdata, metadata, ["#000000"])
+    assert "value_a" in color_data.column_names
+    assert "category_a" not in color_data.column_names
+    value_alpha = color_data["value_a"].to_numpy()
+    assert np.all(value_alpha[:10] == 0)
+    assert np.all(value_alpha[10:] == 255)
+
+
+@pytest.mark.parametrize("min_chroma", [20, None])
+def test_color_sample_from_greyscale_colors(min_chroma):
+    greys = np.repeat(np.linspace(0.1, 0.9, 100)[:, None], 3, axis=1)
+    swatches = color_sample_from_colors(greys, 5, min_chroma=min_chroma)
+    assert len(swatches) == 5
+    for swatch in swatches:
+        assert swatch[1:3] == swatch[3:5] == swatch[5:7]
+
+
+def test_color_sample_from_few_distinct_colors():
+    colors = np.array([[255, 0, 0]] * 3 + [[128, 128, 128]] * 97, dtype=np.float64)
+    swatches = color_sample_from_colors(colors, 5, color_scale=255)
+    assert len(swatches) == 5
+    assert set(swatches) == {"#ff0000", "#808080"}
+
+
+def test_google_font_http_errors_are_not_cached(monkeypatch):
+    responses = [(429, b""), (200, b"@font-face { src: url(https://x/a.woff2) }")]
+
+    def fake_get(url, timeout=None):
+        response = requests.Response()
+        response.status_code, response._content = responses.pop(0)
+        return response
+
+    monkeypatch.setattr(requests, "get", fake_get)
+    assert get_google_font_for_embedding("Uncached Test Font") == ""
+    assert "a.woff2" in get_google_font_for_embedding("Uncached Test Font")
+
+
+def test_coordinate_extents_skip_nan():
+    points = np.array([[np.nan, 0.0], [1.0, 2.0], [3.0, np.nan], [2.0, 4.0]])
+    mins, maxs = _coordinate_extents(points)
+    assert mins.tolist() == [1.0, 0.0]
+    assert maxs.tolist() == [3.0, 4.0]
+    mins, maxs = _coordinate_extents(np.array([[np.nan, 1.0], [np.nan, 2.0]]))
+    assert np.isnan(mins[0]) and np.isnan(maxs[0])
+    assert (mins[1], maxs[1]) == (1.0, 2.0)